@@ -0,0 +1,33 @@
+"""Regenerate the marshal snapshots of the bundled contraction dictionaries.
+
+The JSON files in ``contraction_fix/data`` are the canonical sources. The
+package loads the ``.marshal`` snapshots next to them because ``marshal.loads``
+is cheaper than ``json.loads``. Run this script after editing any JSON file:
+
+    python build_data.py
+"""
+import json
+import marshal
+from pathlib import Path
+from typing import Dict
+
+DATA_DIR = Path(__file__).parent / "contraction_fix" / "data"
+
+# Version 4 is readable by every Python release the package supports
+MARSHAL_VERSION = 4
+
+def main() -> None:
+    for source in sorted(DATA_DIR.glob("*.json")):
+        with source.open(encoding="utf-8") as f:
+            data = json.load(f)
+        
+        # Share equal expansions so marshal stores repeats as back-references
+        values: Dict[str, str] = {}
+        data = {key: values.setdefault(value, value) for key, value in data.items()}
+        
+        target = source.with_suffix(".marshal")
+        target.write_bytes(marshal.dumps(data, MARSHAL_VERSION))
+        print(f"Wrote {target.relative_to(DATA_DIR.parent.parent)} ({len(data)} entries)")
+
+if __name__ == "__main__":
+    main()
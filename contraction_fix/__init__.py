@@ -1,7 +1,14 @@
+from functools import lru_cache
 from typing import List
 from .fixer import ContractionFixer
 
-_default_fixer = ContractionFixer()
+@lru_cache(maxsize=4)
+def _get_fixer(use_informal: bool, use_slang: bool) -> ContractionFixer:
+    """Return a shared fixer for the given configuration, built on first use."""
+    return ContractionFixer(use_informal=use_informal, use_slang=use_slang)
+
+# Build the default configuration eagerly so the first call stays fast
+_get_fixer(True, True)
 
 def fix(text: str, use_informal: bool = True, use_slang: bool = True) -> str:
     """Fix contractions in the given text using the default settings.
@@ -14,28 +21,22 @@ def fix(text: str, use_informal: bool = True, use_slang: bool = True) -> str:
     Returns:
         The text with contractions fixed
     """
-    if use_informal and use_slang:
-        return _default_fixer.fix(text)
-    else:
-        fixer = ContractionFixer(use_informal=use_informal, use_slang=use_slang)
-        return fixer.fix(text)
+    return _get_fixer(use_informal, use_slang).fix(text)
 
-def fix_batch(texts: List[str], use_informal: bool = True, use_slang: bool = True) -> List[str]:
+def fix_batch(texts: List[str], use_informal: bool = True, use_slang: bool = True,
+              workers: int = 1) -> List[str]:
     """Fix contractions in multiple texts efficiently.
     
     Args:
         texts: List of texts to process
         use_informal: Whether to use the informal contractions dictionary
         use_slang: Whether to use the internet slang dictionary
+        workers: Number of worker processes for large batches (-1 uses all CPUs)
         
     Returns:
         List of texts with contractions fixed
     """
-    if use_informal and use_slang:
-        return _default_fixer.fix_batch(texts)
-    else:
-        fixer = ContractionFixer(use_informal=use_informal, use_slang=use_slang)
-        return fixer.fix_batch(texts)
+    return _get_fixer(use_informal, use_slang).fix_batch(texts, workers=workers)
 
 def contract(text: str, use_informal: bool = True, use_slang: bool = True) -> str:
     """Contract expanded forms back to contractions in the given text.
@@ -48,28 +49,22 @@ def contract(text: str, use_informal: bool = True, use_slang: bool = True) -> st
     Returns:
         The text with expanded forms contracted back to contractions
     """
-    if use_informal and use_slang:
-        return _default_fixer.contract(text)
-    else:
-        fixer = ContractionFixer(use_informal=use_informal, use_slang=use_slang)
-        return fixer.contract(text)
+    return _get_fixer(use_informal, use_slang).contract(text)
 
-def contract_batch(texts: List[str], use_informal: bool = True, use_slang: bool = True) -> List[str]:
+def contract_batch(texts: List[str], use_informal: bool = True, use_slang: bool = True,
+                   workers: int = 1) -> List[str]:
     """Contract expanded forms back to contractions in multiple texts efficiently.
     
     Args:
         texts: List of texts to process
         use_informal: Whether to use the informal contractions dictionary
         use_slang: Whether to use the internet slang dictionary
+        workers: Number of worker processes for large batches (-1 uses all CPUs)
         
     Returns:
         List of texts with expanded forms contracted back to contractions
     """
-    if use_informal and use_slang:
-        return _default_fixer.contract_batch(texts)
-    else:
-        fixer = ContractionFixer(use_informal=use_informal, use_slang=use_slang)
-        return fixer.contract_batch(texts)
+    return _get_fixer(use_informal, use_slang).contract_batch(texts, workers=workers)
 
 __version__ = "0.2.2"
 __all__ = ["fix", "fix_batch", "contract", "contract_batch", "ContractionFixer"] 
\ No newline at end of file
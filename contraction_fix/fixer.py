@@ -1,9 +1,166 @@
-from typing import Dict, List, ClassVar, FrozenSet, Tuple, Pattern, Optional
-import json
+from typing import Any, Callable, Dict, Iterable, List, ClassVar, FrozenSet, Mapping, Tuple, Pattern, Optional
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+import marshal
+import os
 import pkgutil
 from functools import lru_cache
 import re
 from threading import Lock
+from types import MappingProxyType
+from weakref import WeakValueDictionary
+
+# Typographic apostrophes are folded to ASCII before matching; the mapping is
+# one code point to one code point, so offsets into the original text hold.
+# U+2018 is left alone: it mostly opens quotations, and folding it would turn
+# quoted words such as 'all' or 'd' into contraction fragments
+_APOSTROPHE_VARIANTS = ("\u2019", "\u02bc")
+_APOSTROPHE_TRANSLATION = str.maketrans(dict.fromkeys(_APOSTROPHE_VARIANTS, "'"))
+_S_SUFFIXES = ("'s",) + tuple(variant + "s" for variant in _APOSTROPHE_VARIANTS)
+
+# Deepest group nesting a trie-rendered pattern may use (see _trie_node_regex)
+_TRIE_MAX_GROUP_DEPTH = 64
+
+# Joins the texts of a batch so they are scanned in a single pass
+_BATCH_SEPARATOR = "\x00"
+
+def _lowered_view(text: str) -> str:
+    """Lowercase text for matching while keeping every offset aligned.
+    
+    Patterns hold lowercase keys only, so the engine never folds case itself.
+    U+0130 is the one code point that lowercases to two; it is swapped for
+    dotless i first, which is lowercase and a word character as well.
+    """
+    view = text.lower()
+    if len(view) != len(text):
+        view = text.replace("\u0130", "\u0131").lower()
+    return view
+
+def _split_original(pattern: Pattern[str], text: str, view: str) -> List[str]:
+    """Split text at the matches the capturing pattern finds in its view.
+    
+    The view has the same length as the text, so the lengths of its parts
+    locate the original slices.
+    """
+    parts = pattern.split(view)
+    if len(parts) == 1:
+        return [text]
+    if view == text:
+        return parts
+    originals: List[str] = []
+    append = originals.append
+    pos = 0
+    for part in parts:
+        end = pos + len(part)
+        append(text[pos:end])
+        pos = end
+    return originals
+
+def _trie_regex(keys: Iterable[str]) -> str:
+    """Build a prefix-factored alternation matching any of the literal keys.
+    
+    Keys sharing a prefix share a single branch, so the regex engine decides
+    on each character once instead of retrying every alternative. Greedy
+    optional groups keep the longest-match-first semantics of a length-sorted
+    alternation.
+    """
+    trie: Dict[str, Any] = {}
+    for key in keys:
+        node = trie
+        for char in key:
+            node = node.setdefault(char, {})
+        node[''] = None
+    return _trie_node_regex(trie)
+
+def _trie_node_regex(root: Dict[str, Any]) -> str:
+    """Render a trie (see ``_trie_regex``) as a regex fragment.
+    
+    Nodes are rendered children first from an explicit stack, so keys of any
+    length stay clear of the interpreter's recursion limit. The regex parser
+    recurses per nested group as well, so a subtree that would nest deeper
+    than ``_TRIE_MAX_GROUP_DEPTH`` is emitted as a flat longest-first
+    alternation of its suffixes instead.
+    """
+    rendered: Dict[int, Tuple[str, int]] = {}
+    stack: List[Tuple[Dict[str, Any], Optional[List[Tuple[str, Any]]]]] = [(root, None)]
+    while stack:
+        node, children = stack.pop()
+        if children is None:
+            # Chains of single-child nodes render as one literal label
+            children = []
+            for label, child in sorted(node.items()):
+                if not label:
+                    continue
+                while len(child) == 1 and '' not in child:
+                    (char, child), = child.items()
+                    label += char
+                children.append((label, child))
+            stack.append((node, children))
+            stack.extend((child, None) for _, child in children)
+            continue
+        
+        branches = []
+        depth = 0
+        for label, child in children:
+            child_fragment, child_depth = rendered.pop(id(child))
+            branches.append(re.escape(label) + child_fragment)
+            if child_depth > depth:
+                depth = child_depth
+        if not branches:
+            fragment = ''
+        elif len(branches) == 1 and '' not in node:
+            fragment = branches[0]
+        elif depth >= _TRIE_MAX_GROUP_DEPTH:
+            suffixes = sorted(_trie_suffixes(node), key=len, reverse=True)
+            fragment, depth = f"(?:{'|'.join(map(re.escape, suffixes))})", 1
+        else:
+            body = f"(?:{'|'.join(branches)})"
+            fragment, depth = (body + '?' if '' in node else body), depth + 1
+        rendered[id(node)] = (fragment, depth)
+    return rendered[id(root)][0]
+
+def _trie_suffixes(root: Dict[str, Any]) -> List[str]:
+    """List every key suffix stored below a trie node."""
+    suffixes = []
+    stack = [('', root)]
+    while stack:
+        prefix, node = stack.pop()
+        for char, child in node.items():
+            if char:
+                stack.append((prefix + char, child))
+            else:
+                suffixes.append(prefix)
+    return suffixes
+
+def _first_char_prefilter(keys: Iterable[str]) -> str:
+    """Build a lookahead on the possible first characters of the keys.
+    
+    A leading character class lets the regex engine skip ahead to candidate
+    positions in C instead of attempting the full pattern at every offset.
+    """
+    first_chars = sorted({re.escape(key[0]) for key in keys if key})
+    return f"(?=[{''.join(first_chars)}])" if first_chars else ''
+
+def _case_forms(mapping: Mapping[str, str]) -> Dict[str, Tuple[str, str, str]]:
+    """Precompute the (as-is, upper, capitalized) forms of every replacement.
+    
+    Keys with the same replacement share one tuple, and forms equal to the
+    replacement reuse it, so duplicated expansions cost a single pointer.
+    """
+    forms_by_value: Dict[str, Tuple[str, str, str]] = {}
+    case_forms = {}
+    for k, v in mapping.items():
+        forms = forms_by_value.get(v)
+        if forms is None:
+            upper, capitalized = v.upper(), v.capitalize()
+            forms = forms_by_value[v] = (v, v if upper == v else upper,
+                                         v if capitalized == v else capitalized)
+        case_forms[k] = forms
+    return case_forms
+
+def _read_only(mapping: Mapping[str, str]) -> Mapping[str, str]:
+    """Wrap a dictionary in a read-only view unless it already is one."""
+    return mapping if isinstance(mapping, MappingProxyType) else MappingProxyType(mapping)
 
 class Match:
     """Represents a contraction match with context information."""
@@ -27,7 +184,7 @@ class ContractionFixer:
         'something', 'nobody', 'let'
     })
     
-    # Keep TIME_WORDS for test compatibility
+    # Time words whose 's form is a contraction; part of S_CONTRACTION_BASES
     TIME_WORDS: ClassVar[FrozenSet[str]] = frozenset({
         'today', 'tomorrow', 'tonight', 'morning', 'evening', 'afternoon',
         'week', 'month', 'year', 'century', 'monday', 'tuesday', 'wednesday',
@@ -40,6 +197,9 @@ class ContractionFixer:
         "august", "september", "october", "november", "december"
     )
     
+    # Bases whose 's form is treated as a contraction, merged for one lookup
+    S_CONTRACTION_BASES: ClassVar[FrozenSet[str]] = CONTRACTION_BASES | TIME_WORDS
+    
     # Pre-compiled safe contractions set for faster lookup
     SAFE_CONTRACTIONS: ClassVar[FrozenSet[str]] = frozenset({
         "am not", "are not", "cannot", "could not", "did not", "do not", "does not",
@@ -62,8 +222,26 @@ class ContractionFixer:
         "nothing": "nothin'"
     }
 
-    __slots__ = ('_lock', 'combined_dict', 'reverse_dict', '_pattern', '_reverse_pattern', 
-                 '_use_informal', '_use_slang', '_cache_size', '_fix_cache', '_contract_cache')
+    # Texts shorter than this are memoized whole; longer ones rarely repeat
+    # and would cost a full hash per call
+    _TEXT_CACHE_MAX_LENGTH: ClassVar[int] = 256
+
+    # Compiled patterns shared by every instance with the same key set
+    _PATTERN_CACHE: ClassVar["WeakValueDictionary[Tuple[str, FrozenSet[str]], Pattern[str]]"] = WeakValueDictionary()
+
+    __slots__ = ('_lock', 'combined_dict', 'reverse_dict', '_pattern', '_word_pattern', '_reverse_pattern', 
+                 '_use_informal', '_use_slang', '_cache_size', '_fix_token_cache', '_contract_token_cache',
+                 '_fix_text_cache', '_contract_text_cache',
+                 '_fix_case_forms', '_contract_case_forms', '_s_contractions', '_batch_joinable')
+
+    # Read-only views; updates go through add_contractions/remove_contraction
+    combined_dict: Mapping[str, str]
+    reverse_dict: Mapping[str, str]
+    
+    # Compiled patterns are published lazily, so the slots may hold None
+    _pattern: Optional[Pattern[str]]
+    _word_pattern: Optional[Pattern[str]]
+    _reverse_pattern: Optional[Pattern[str]]
 
     def __init__(self, use_informal: bool = True, use_slang: bool = True, cache_size: int = 1024):
         """Initialize the contraction fixer with optional dictionaries."""
@@ -71,61 +249,98 @@ class ContractionFixer:
         self._use_informal = use_informal
         self._use_slang = use_slang
         self._cache_size = cache_size
-        self._pattern: Optional[Pattern[str]] = None
-        self._reverse_pattern: Optional[Pattern[str]] = None
-        self._fix_cache = None
-        self._contract_cache = None
         
         try:
-            # Load and build dictionaries efficiently
-            self.combined_dict, self.reverse_dict = self._build_dictionaries()
+            # Start from the shared default state, then derive patterns and caches
+            self._swap_dictionaries(*self._default_state(bool(use_informal), bool(use_slang)))
             
         except Exception as e:
             raise RuntimeError(f"Failed to initialize ContractionFixer: {str(e)}")
 
-    def _load_dict_optimized(self, filename: str) -> Dict[str, str]:
-        """Load a dictionary from a JSON file with optimized processing."""
+    @staticmethod
+    @lru_cache(maxsize=8)
+    def _load_dict_optimized(name: str) -> Dict[str, str]:
+        """Load a dictionary from its marshal snapshot (see ``build_data.py``).
+        
+        Loaded dictionaries are shared by all instances and must not be mutated.
+        """
+        filename = f"{name}.marshal"
         try:
             data = pkgutil.get_data("contraction_fix", f"data/{filename}")
             if data is None:
                 raise FileNotFoundError(f"Dictionary file {filename} not found")
             
-            raw_dict = json.loads(data.decode("utf-8"))
+            # marshal decodes in C without JSON tokenizing
+            raw_dict = marshal.loads(data)
             # Use dict comprehension for memory efficiency
             return {k.lower(): v for k, v in raw_dict.items()}
-        except json.JSONDecodeError as e:
-            raise ValueError(f"Invalid JSON in {filename}: {str(e)}")
+        except (ValueError, EOFError, TypeError) as e:
+            raise ValueError(f"Invalid dictionary data in {filename}: {str(e)}")
         except Exception as e:
             raise RuntimeError(f"Failed to load dictionary {filename}: {str(e)}")
 
-    def _build_dictionaries(self) -> Tuple[Dict[str, str], Dict[str, str]]:
+    @classmethod
+    def _build_dictionaries(cls, use_informal: bool, use_slang: bool) -> Tuple[Dict[str, str], Dict[str, str]]:
         """Build both dictionaries in a single pass for efficiency."""
         # Load base dictionaries
-        standard = self._load_dict_optimized("standard_contractions.json")
-        informal = self._load_dict_optimized("informal_contractions.json") if self._use_informal else {}
-        slang = self._load_dict_optimized("internet_slang.json") if self._use_slang else {}
+        standard = cls._load_dict_optimized("standard_contractions")
+        informal = cls._load_dict_optimized("informal_contractions") if use_informal else {}
+        slang = cls._load_dict_optimized("internet_slang") if use_slang else {}
         
         # Build combined dictionary
         combined_dict = dict(standard)
-        if self._use_informal:
+        if use_informal:
             combined_dict.update(informal)
-        if self._use_slang:
+        if use_slang:
             combined_dict.update(slang)
         
-        # Add alternative apostrophes in the same loop
-        alt_entries = {}
-        for k, v in combined_dict.items():
-            if "'" in k:
-                alt_entries[k.replace("'", "'")] = v
-        combined_dict.update(alt_entries)
+        # Start from the shared standard reverse mapping
+        reverse_dict = dict(cls._standard_reverse_dict())
+        
+        # Add informal contractions if enabled
+        if use_informal:
+            reverse_dict.update(cls.SAFE_INFORMAL)
+        
+        return combined_dict, reverse_dict
+
+    @classmethod
+    @lru_cache(maxsize=4)
+    def _default_state(cls, use_informal: bool, use_slang: bool) -> Tuple[Mapping[str, str], Mapping[str, str], Tuple[Any, ...]]:
+        """Build the default dictionaries and their tables once per configuration.
+        
+        The dictionaries are returned as read-only views, so every instance
+        with the same configuration can share them safely.
+        """
+        combined_dict, reverse_dict = cls._build_dictionaries(use_informal, use_slang)
+        return (MappingProxyType(combined_dict), MappingProxyType(reverse_dict),
+                cls._derived_tables(combined_dict, reverse_dict))
+
+    @classmethod
+    def _derived_tables(cls, combined_dict: Mapping[str, str], reverse_dict: Mapping[str, str]) -> Tuple[Any, ...]:
+        """Build the case-form and 's tables for a pair of dictionaries.
+        
+        The last entry tells whether batches may be joined on the separator,
+        which only holds while no key or replacement contains it.
+        """
+        batch_joinable = not any(_BATCH_SEPARATOR in entry
+                                 for mapping in (combined_dict, reverse_dict)
+                                 for item in mapping.items() for entry in item)
+        return (_case_forms(combined_dict), _case_forms(reverse_dict),
+                cls._s_contraction_table(combined_dict), batch_joinable)
+
+    @classmethod
+    @lru_cache(maxsize=4)
+    def _standard_reverse_dict(cls) -> Dict[str, str]:
+        """Build the reverse mapping for standard contractions once per class.
         
-        # Build reverse dictionary efficiently
-        reverse_dict = {}
+        The result is shared by all instances and must not be mutated.
+        """
+        reverse_dict: Dict[str, str] = {}
         
         # Process standard contractions for reverse
-        for contraction, expansion in standard.items():
+        for contraction, expansion in cls._load_dict_optimized("standard_contractions").items():
             expansion_lower = expansion.lower()
-            if (expansion_lower in self.SAFE_CONTRACTIONS and 
+            if (expansion_lower in cls.SAFE_CONTRACTIONS and 
                 "'" in contraction and len(contraction) > 2):
                 
                 existing = reverse_dict.get(expansion_lower)
@@ -134,18 +349,7 @@ class ContractionFixer:
                     (len(contraction) < len(existing) and not contraction.startswith("'"))):
                     reverse_dict[expansion_lower] = contraction
         
-        # Add informal contractions if enabled
-        if self._use_informal:
-            reverse_dict.update(self.SAFE_INFORMAL)
-        
-        # Add alternative apostrophes for reverse dict
-        alt_reverse = {}
-        for k, v in reverse_dict.items():
-            if "'" in v:
-                alt_reverse[k] = v.replace("'", "'")
-        reverse_dict.update(alt_reverse)
-        
-        return combined_dict, reverse_dict
+        return reverse_dict
 
     @property
     def pattern(self) -> Pattern[str]:
@@ -153,25 +357,57 @@ class ContractionFixer:
         if self._pattern is not None:
             return self._pattern
             
-        # Optimize pattern compilation with single regex construction
-        sorted_keys = sorted(self.combined_dict.keys(), key=lambda x: (-len(x), x))
-        
-        # Build efficient pattern with word boundaries
-        escaped_keys = [re.escape(key) for key in sorted_keys]
-        
-        # Use alternation with optimized word boundary detection
-        apostrophe_pattern = '|'.join(k for k in escaped_keys if "'" in k or "'" in k)
-        word_pattern = '|'.join(k for k in escaped_keys if "'" not in k and "'" not in k)
+        # Build from one snapshot; a concurrent swap may replace the attribute
+        combined_dict = self.combined_dict
+        cache_key = ('forward', frozenset(combined_dict))
+        pattern = self._PATTERN_CACHE.get(cache_key)
+        if pattern is None:
+            # Build prefix-factored alternations, split by word boundary style
+            apostrophe_keys = [k for k in combined_dict if "'" in k]
+            word_keys = [k for k in combined_dict if "'" not in k]
+            apostrophe_pattern = _trie_regex(apostrophe_keys)
+            word_pattern = _trie_regex(word_keys)
+            
+            pattern_parts = []
+            if apostrophe_pattern:
+                pattern_parts.append(f"(?<!\\w)(?:{apostrophe_pattern})(?!\\w)")
+            if word_pattern:
+                pattern_parts.append(f"\\b(?:{word_pattern})\\b")
+            
+            prefilter = _first_char_prefilter(combined_dict)
+            pattern_str = f"{prefilter}({'|'.join(pattern_parts)})" if pattern_parts else r'(?!.*)'
+            pattern = re.compile(pattern_str)
+            self._PATTERN_CACHE[cache_key] = pattern
         
-        pattern_parts = []
-        if apostrophe_pattern:
-            pattern_parts.append(f"(?<!\\w)(?:{apostrophe_pattern})(?!\\w)")
-        if word_pattern:
-            pattern_parts.append(f"\\b(?:{word_pattern})\\b")
+        # Only publish a pattern that still matches the current dictionary;
+        # writers swap under the lock, so check and store under it too
+        with self._lock:
+            if self.combined_dict is combined_dict:
+                self._pattern = pattern
+        return pattern
+
+    @property
+    def word_pattern(self) -> Pattern[str]:
+        """Lazily compile and cache the regex pattern for contractions without apostrophes."""
+        if self._word_pattern is not None:
+            return self._word_pattern
+            
+        combined_dict = self.combined_dict
+        word_keys = frozenset(k for k in combined_dict if "'" not in k)
+        cache_key = ('word', word_keys)
+        pattern = self._PATTERN_CACHE.get(cache_key)
+        if pattern is None:
+            # Same word branch as the full pattern, minus the apostrophe keys
+            word_pattern = _trie_regex(word_keys)
+            prefilter = _first_char_prefilter(word_keys)
+            pattern_str = f"{prefilter}(\\b(?:{word_pattern})\\b)" if word_pattern else r'(?!.*)'
+            pattern = re.compile(pattern_str)
+            self._PATTERN_CACHE[cache_key] = pattern
         
-        pattern_str = f"({'|'.join(pattern_parts)})" if pattern_parts else r'(?!.*)'
-        self._pattern = re.compile(pattern_str, re.IGNORECASE)
-        return self._pattern
+        with self._lock:
+            if self.combined_dict is combined_dict:
+                self._word_pattern = pattern
+        return pattern
 
     @property
     def reverse_pattern(self) -> Pattern[str]:
@@ -179,182 +415,294 @@ class ContractionFixer:
         if self._reverse_pattern is not None:
             return self._reverse_pattern
             
-        # Optimize reverse pattern compilation
-        sorted_keys = sorted(self.reverse_dict.keys(), key=lambda x: (-len(x), x))
-        escaped_keys = [re.escape(key) for key in sorted_keys]
+        reverse_dict = self.reverse_dict
+        cache_key = ('reverse', frozenset(reverse_dict))
+        pattern = self._PATTERN_CACHE.get(cache_key)
+        if pattern is None:
+            # Build a prefix-factored alternation over all expanded forms
+            reverse_body = _trie_regex(reverse_dict)
+            prefilter = _first_char_prefilter(reverse_dict)
+            pattern_str = f"{prefilter}\\b({reverse_body})\\b" if reverse_body else r'(?!.*)'
+            pattern = re.compile(pattern_str)
+            self._PATTERN_CACHE[cache_key] = pattern
         
-        pattern_str = f"\\b({'|'.join(escaped_keys)})\\b" if escaped_keys else r'(?!.*)'
-        self._reverse_pattern = re.compile(pattern_str, re.IGNORECASE)
-        return self._reverse_pattern
+        with self._lock:
+            if self.reverse_dict is reverse_dict:
+                self._reverse_pattern = pattern
+        return pattern
 
-    def _is_contraction_s_optimized(self, word: str) -> bool:
+    @classmethod
+    def _is_contraction_s_optimized(cls, word: str, word_lower: Optional[str] = None) -> bool:
         """Optimized contraction 's detection with early returns."""
         if len(word) < 3:
             return False
             
-        base = word[:-2].lower()
+        base = (word.lower() if word_lower is None else word_lower)[:-2]
         
         # Fast path: check base words that commonly form contractions
-        if base in self.CONTRACTION_BASES:
+        if base in cls.S_CONTRACTION_BASES:
             return True
             
-        # Check ending patterns that typically don't form contractions
-        if base.endswith(('s', 'x', 'z', 'ch', 'sh')):
+        # Sibilant endings typically form possessives, not contractions
+        if base[-1] in 'sxz' or base[-2:] in ('ch', 'sh'):
             return False
         
         # Check if starts with uppercase (likely proper noun)
         return not word[0].isupper()
 
+    @classmethod
+    def _s_contraction_table(cls, combined_dict: Mapping[str, str]) -> Dict[str, Optional[bool]]:
+        """Precompute the 's check for every key ending in 's.
+        
+        Keys whose outcome depends on the case of the matched token map to
+        None and are still checked per token.
+        """
+        table: Dict[str, Optional[bool]] = {}
+        for key in combined_dict:
+            if key.endswith("'s"):
+                lower_result = cls._is_contraction_s_optimized(key, key)
+                capitalized_result = cls._is_contraction_s_optimized(key.capitalize(), key)
+                table[key] = lower_result if lower_result == capitalized_result else None
+        return table
+
     def _fix_single_optimized(self, text: str) -> str:
-        """Optimized single text fixing with reduced overhead."""
-        # Initialize cache if needed
-        if self._fix_cache is None:
-            from functools import lru_cache
-            self._fix_cache = lru_cache(maxsize=self._cache_size)(self._fix_single_impl)
+        """Optimized single text fixing with per-token cached replacements."""
+        # Match on a lowercased, apostrophe-normalized view of the same length
+        # and emit the original slices
+        view = _lowered_view(text)
+        if not text.isascii() and any(variant in text for variant in _APOSTROPHE_VARIANTS):
+            view = view.translate(_APOSTROPHE_TRANSLATION)
+        
+        # Apostrophe keys cannot match without an apostrophe, so such
+        # texts only need the much cheaper scan for the word keys
+        # Read the compiled slots directly; the properties only run on a rebuild
+        if "'" in view:
+            pattern = self._pattern or self.pattern
+        else:
+            pattern = self._word_pattern or self.word_pattern
         
-        return self._fix_cache(text)
+        # Splitting on the capturing pattern yields [text, match, text, ...];
+        # resolving the odd slots through the C-level cache avoids a Python
+        # callback per match that re.sub would need
+        parts = _split_original(pattern, text, view)
+        parts[1::2] = map(self._fix_token_cache, parts[1::2])
+        return ''.join(parts)
     
-    def _fix_single_impl(self, text: str) -> str:
-        """Implementation of single text fixing."""
-        def replace_match(match):
-            matched_text = match.group(0)
-            
-            # Fast path for 's contractions
-            if matched_text.endswith(("'s", "'s")):
-                if not self._is_contraction_s_optimized(matched_text):
-                    return matched_text
-            
-            matched_lower = matched_text.lower()
-            replacement = self.combined_dict.get(matched_lower)
-            
-            if replacement is None:
+    def _resolve_fix_token(self, matched_text: str) -> str:
+        """Resolve the replacement for a single matched token."""
+        # Normalize once and share it between the lookup and the 's check
+        matched_lower = matched_text.lower().translate(_APOSTROPHE_TRANSLATION)
+        forms = self._fix_case_forms.get(matched_lower)
+        
+        if forms is None:
+            return matched_text
+        
+        # Fast path for 's contractions, decided per key where case cannot matter
+        if matched_text.endswith(_S_SUFFIXES):
+            is_contraction = self._s_contractions.get(matched_lower)
+            if is_contraction is None:
+                is_contraction = self._is_contraction_s_optimized(matched_text, matched_lower)
+            if not is_contraction:
                 return matched_text
-            
-            # Optimized case handling
-            if matched_text.isupper():
-                return replacement.upper()
-            elif matched_text[0].isupper():
-                return replacement.capitalize()
-            else:
-                return replacement
-                
-        return self.pattern.sub(replace_match, text)
+        
+        # Case checks only run once the token is known to be replaced
+        if matched_text.isupper():
+            return forms[1]
+        elif matched_text[0].isupper():
+            return forms[2]
+        else:
+            return forms[0]
 
     def _contract_single_optimized(self, text: str) -> str:
-        """Optimized contracting with reduced overhead."""
-        # Initialize cache if needed
-        if self._contract_cache is None:
-            from functools import lru_cache
-            self._contract_cache = lru_cache(maxsize=self._cache_size)(self._contract_single_impl)
-        
-        return self._contract_cache(text)
+        """Optimized contracting with per-token cached replacements."""
+        parts = _split_original(self._reverse_pattern or self.reverse_pattern, text, _lowered_view(text))
+        parts[1::2] = map(self._contract_token_cache, parts[1::2])
+        return ''.join(parts)
     
-    def _contract_single_impl(self, text: str) -> str:
-        """Implementation of single text contracting."""
-        def replace_match(match):
-            matched_text = match.group(0)
-            matched_lower = matched_text.lower()
+    def _resolve_contract_token(self, matched_text: str) -> str:
+        """Resolve the contraction for a single matched expanded form."""
+        forms = self._contract_case_forms.get(matched_text.lower())
+        if forms is None:
+            return matched_text
             
-            replacement = self.reverse_dict.get(matched_lower)
-            if replacement is None:
-                return matched_text
-                
-            # Optimized case handling
-            if matched_text.isupper():
-                return replacement.upper()
-            elif matched_text[0].isupper():
-                return replacement.capitalize()
-            else:
-                return replacement
-                
-        return self.reverse_pattern.sub(replace_match, text)
+        # Optimized case handling
+        if matched_text.isupper():
+            return forms[1]
+        elif matched_text[0].isupper():
+            return forms[2]
+        else:
+            return forms[0]
 
     def fix(self, text: str) -> str:
         """Fix contractions in the given text."""
+        if len(text) < self._TEXT_CACHE_MAX_LENGTH:
+            return self._fix_text_cache(text)
         return self._fix_single_optimized(text)
 
-    def fix_batch(self, texts: List[str]) -> List[str]:
-        """Optimized batch processing with list comprehension."""
-        return [self._fix_single_optimized(text) for text in texts]
+    def fix_batch(self, texts: List[str], workers: int = 1) -> List[str]:
+        """Optimized batch processing, optionally spread over worker processes."""
+        # Texts are read more than once below, so materialize iterators
+        texts = list(texts)
+        workers = self._resolve_workers(workers)
+        if self._use_workers(texts, workers):
+            return self._run_parallel('fix_batch', texts, workers)
+        return self._run_joined(self._fix_single_optimized, self.fix, texts)
 
     def contract(self, text: str) -> str:
         """Contract expanded forms back to contractions in the given text."""
+        if len(text) < self._TEXT_CACHE_MAX_LENGTH:
+            return self._contract_text_cache(text)
         return self._contract_single_optimized(text)
 
-    def contract_batch(self, texts: List[str]) -> List[str]:
-        """Optimized batch contracting."""
-        return [self._contract_single_optimized(text) for text in texts]
+    def contract_batch(self, texts: List[str], workers: int = 1) -> List[str]:
+        """Optimized batch contracting, optionally spread over worker processes."""
+        texts = list(texts)
+        workers = self._resolve_workers(workers)
+        if self._use_workers(texts, workers):
+            return self._run_parallel('contract_batch', texts, workers)
+        return self._run_joined(self._contract_single_optimized, self.contract, texts)
+
+    def _run_joined(self, single: Callable[[str], str], fallback: Callable[[str], str], texts: List[str]) -> List[str]:
+        """Process the distinct texts in one scan over their separator-joined form."""
+        # The separator is a non-word character, so while no key or
+        # replacement contains it, matches can neither span two texts nor
+        # change at their edges
+        if not self._batch_joinable:
+            return [fallback(text) for text in texts]
+        unique = list(dict.fromkeys(texts))
+        joined = _BATCH_SEPARATOR.join(unique)
+        if joined.count(_BATCH_SEPARATOR) != len(unique) - 1:
+            return [fallback(text) for text in texts]
+        parts = single(joined).split(_BATCH_SEPARATOR)
+        if len(parts) != len(unique):
+            return [fallback(text) for text in texts]
+        results = dict(zip(unique, parts))
+        return [results[text] for text in texts]
+
+    @staticmethod
+    def _resolve_workers(workers: int) -> int:
+        """Turn the requested worker count into an actual one (-1 uses every CPU)."""
+        if workers == -1:
+            return os.cpu_count() or 1
+        return workers
+
+    @staticmethod
+    def _use_workers(texts: List[str], workers: int) -> bool:
+        """Check whether a batch is large enough to be worth a process pool."""
+        return workers > 1 and len(texts) > workers * 8
+
+    def _run_parallel(self, method: str, texts: List[str], workers: int) -> List[str]:
+        """Split texts into one chunk per worker and process them in a pool."""
+        chunk_size = -(-len(texts) // workers)
+        chunks = [texts[i:i + chunk_size] for i in range(0, len(texts), chunk_size)]
+        # Views do not pickle, so workers receive plain copies; the class is
+        # passed along so subclasses keep their overrides in the workers
+        state = (type(self), self._use_informal, self._use_slang, self._cache_size,
+                 dict(self.combined_dict), dict(self.reverse_dict))
+        
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = executor.map(ContractionFixer._process_chunk, repeat(state), repeat(method), chunks)
+            return [text for chunk in results for text in chunk]
+
+    @staticmethod
+    def _process_chunk(state: Tuple[Any, ...], method: str, texts: List[str]) -> List[str]:
+        """Rebuild a fixer from pickled state inside a worker and run one chunk."""
+        cls, use_informal, use_slang, cache_size, combined_dict, reverse_dict = state
+        fixer = cls(use_informal=use_informal, use_slang=use_slang, cache_size=cache_size)
+        fixer._swap_dictionaries(combined_dict, reverse_dict)
+        return getattr(fixer, method)(texts)
 
     def preview(self, text: str, context_size: int = 10) -> List[Match]:
         """Preview contractions in the text with context."""
-        matches = []
+        matches: List[Match] = []
+        append = matches.append
         text_len = len(text)
+        combined_get = self.combined_dict.get
         
-        for match in self.pattern.finditer(text):
-            start_idx = max(0, match.start() - context_size)
-            end_idx = min(text_len, match.end() + context_size)
-            context = text[start_idx:end_idx]
-            matched_text = match.group(0)
-            replacement = self.combined_dict.get(matched_text.lower(), matched_text)
-            
-            matches.append(Match(
-                text=matched_text,
-                start=match.start(),
-                end=match.end(),
-                replacement=replacement,
-                context=context
-            ))
+        # Offsets found on the normalized view index the original text too
+        view = _lowered_view(text)
+        if not text.isascii() and any(variant in text for variant in _APOSTROPHE_VARIANTS):
+            view = view.translate(_APOSTROPHE_TRANSLATION)
+        pattern = self.pattern if "'" in view else self.word_pattern
+        for match in pattern.finditer(view):
+            start, end = match.span()
+            matched_text = text[start:end]
+            replacement = combined_get(match.group(), matched_text)
+            context = text[max(0, start - context_size):min(text_len, end + context_size)]
+            append(Match(matched_text, start, end, replacement, context))
         return matches
 
     def add_contraction(self, contraction: str, expansion: str) -> None:
-        """Add a new contraction to the dictionary with optimized updates."""
+        """Add a new contraction to the dictionary with copy-on-write updates."""
+        self.add_contractions({contraction: expansion})
+
+    def add_contractions(self, contractions: Dict[str, str]) -> None:
+        """Add several contractions at once, rebuilding derived state only once."""
         with self._lock:
-            contraction_lower = contraction.lower()
-            expansion_lower = expansion.lower()
-            
-            # Update dictionaries
-            self.combined_dict[contraction_lower] = expansion
-            self.combined_dict[contraction_lower.replace("'", "'")] = expansion
-            
-            # Update reverse dict if applicable
-            if "'" in contraction_lower and len(contraction_lower) > 1:
-                existing = self.reverse_dict.get(expansion_lower)
-                if existing is None or len(contraction_lower) < len(existing):
-                    self.reverse_dict[expansion_lower] = contraction_lower
+            combined_get = self.combined_dict.get
+            reverse_get = self.reverse_dict.get
+            combined_updates: Dict[str, str] = {}
+            reverse_updates: Dict[str, str] = {}
             
-            # Clear cached properties
-            self._pattern = None
-            self._reverse_pattern = None
+            for contraction, expansion in contractions.items():
+                contraction_lower = contraction.lower().translate(_APOSTROPHE_TRANSLATION)
+                expansion_lower = expansion.lower()
+                combined_updates[contraction_lower] = expansion
+                
+                # Update reverse dict if applicable
+                if "'" in contraction_lower and len(contraction_lower) > 1:
+                    existing = reverse_updates.get(expansion_lower) or reverse_get(expansion_lower)
+                    if existing is None or len(contraction_lower) < len(existing):
+                        reverse_updates[expansion_lower] = contraction_lower
             
-            # Clear instance caches
-            if self._fix_cache:
-                self._fix_cache.cache_clear()
-            if self._contract_cache:
-                self._contract_cache.cache_clear()
+            # Unchanged dictionaries keep their compiled patterns and caches
+            combined_updates = {k: v for k, v in combined_updates.items() if combined_get(k) != v}
+            if combined_updates or reverse_updates:
+                # Publish merged copies so concurrent readers keep a consistent snapshot
+                self._swap_dictionaries({**self.combined_dict, **combined_updates},
+                                        {**self.reverse_dict, **reverse_updates})
 
     def remove_contraction(self, contraction: str) -> None:
-        """Remove a contraction from the dictionary with optimized updates."""
+        """Remove a contraction from the dictionary with copy-on-write updates."""
         with self._lock:
-            contraction_lower = contraction.lower()
+            contraction_lower = contraction.lower().translate(_APOSTROPHE_TRANSLATION)
+            if contraction_lower not in self.combined_dict:
+                return
             
             # Get expansion before removal
             expansion = self.combined_dict.get(contraction_lower)
             
-            # Remove from dictionaries
-            self.combined_dict.pop(contraction_lower, None)
-            self.combined_dict.pop(contraction_lower.replace("'", "'"), None)
+            # Update copies so concurrent readers keep a consistent snapshot
+            combined_dict = dict(self.combined_dict)
+            combined_dict.pop(contraction_lower, None)
             
             # Update reverse dict
-            if expansion and expansion.lower() in self.reverse_dict:
-                if self.reverse_dict[expansion.lower()] == contraction_lower:
-                    del self.reverse_dict[expansion.lower()]
-            
-            # Clear cached properties
-            self._pattern = None
-            self._reverse_pattern = None
+            reverse_dict: Mapping[str, str] = self.reverse_dict
+            if expansion and reverse_dict.get(expansion.lower()) == contraction_lower:
+                reverse_dict = {k: v for k, v in reverse_dict.items() if k != expansion.lower()}
             
-            # Clear instance caches
-            if self._fix_cache:
-                self._fix_cache.cache_clear()
-            if self._contract_cache:
-                self._contract_cache.cache_clear() 
\ No newline at end of file
+            self._swap_dictionaries(combined_dict, reverse_dict)
+
+    def _swap_dictionaries(self, combined_dict: Mapping[str, str], reverse_dict: Mapping[str, str],
+                           tables: Optional[Tuple[Any, ...]] = None) -> None:
+        """Publish new dictionaries and reset everything derived from them.
+        
+        Each attribute is rebound rather than mutated, so a reader always sees
+        either the old or the new dictionary, never one that is half updated.
+        Caches are replaced instead of cleared, so entries computed from the
+        old dictionaries by in-flight readers never land in the new cache.
+        """
+        # Derived tables go first so readers of a new dict never see old ones
+        if tables is None:
+            tables = self._derived_tables(combined_dict, reverse_dict)
+        self._fix_case_forms, self._contract_case_forms, self._s_contractions, self._batch_joinable = tables
+        
+        self.combined_dict = _read_only(combined_dict)
+        self.reverse_dict = _read_only(reverse_dict)
+        self._pattern = None
+        self._word_pattern = None
+        self._reverse_pattern = None
+        self._fix_token_cache = lru_cache(maxsize=self._cache_size)(self._resolve_fix_token)
+        self._contract_token_cache = lru_cache(maxsize=self._cache_size)(self._resolve_contract_token)
+        self._fix_text_cache = lru_cache(maxsize=self._cache_size)(self._fix_single_optimized)
+        self._contract_text_cache = lru_cache(maxsize=self._cache_size)(self._contract_single_optimized)
@@ -18,7 +18,10 @@ setup(
         "contraction_fix": [
             "data/standard_contractions.json",
             "data/informal_contractions.json",
-            "data/internet_slang.json"
+            "data/internet_slang.json",
+            "data/standard_contractions.marshal",
+            "data/informal_contractions.marshal",
+            "data/internet_slang.marshal"
         ],
     },
     install_requires=[],
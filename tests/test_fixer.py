@@ -1,9 +1,20 @@
 import unittest
+import json
+import marshal
+import pkgutil
+import re
 import threading
 import time
 from unittest.mock import patch, mock_open
-from contraction_fix.fixer import ContractionFixer, Match
-from contraction_fix import fix, fix_batch, contract, contract_batch
+from contraction_fix.fixer import ContractionFixer, Match, _trie_regex, _first_char_prefilter
+from contraction_fix import fix, fix_batch, contract, contract_batch, _get_fixer
+
+class ShoutingFixer(ContractionFixer):
+    """Subclass used to check that worker processes keep overrides."""
+    __slots__ = ()
+    
+    def _resolve_fix_token(self, matched_text):
+        return super()._resolve_fix_token(matched_text).upper()
 
 class TestContractionFixer(unittest.TestCase):
     def setUp(self):
@@ -246,6 +257,11 @@ class TestContractionFixer(unittest.TestCase):
         self.assertIn('tomorrow', ContractionFixer.TIME_WORDS)
         self.assertIn('monday', ContractionFixer.TIME_WORDS)
         
+        # Test S_CONTRACTION_BASES covers both sets
+        self.assertIsInstance(ContractionFixer.S_CONTRACTION_BASES, frozenset)
+        self.assertLessEqual(ContractionFixer.CONTRACTION_BASES, ContractionFixer.S_CONTRACTION_BASES)
+        self.assertLessEqual(ContractionFixer.TIME_WORDS, ContractionFixer.S_CONTRACTION_BASES)
+        
         # Test MONTHS
         self.assertIsInstance(ContractionFixer.MONTHS, tuple)
         self.assertIn('january', ContractionFixer.MONTHS)
@@ -283,6 +299,33 @@ class TestContractionFixer(unittest.TestCase):
         self.assertEqual(len(errors), 0, f"Thread safety test failed with errors: {errors}")
         self.assertEqual(len(results), 500)  # 5 threads * 100 iterations
 
+    def test_shared_fixer_concurrent_updates(self):
+        """Test that readers of a shared fixer tolerate concurrent updates."""
+        fixer = ContractionFixer()
+        errors = []
+        done = threading.Event()
+        
+        def reader():
+            try:
+                while not done.is_set():
+                    self.assertEqual(fixer.fix("I can't go"), "I cannot go")
+                    self.assertEqual(fixer.contract("I cannot go"), "I can't go")
+            except Exception as e:
+                errors.append(e)
+        
+        readers = [threading.Thread(target=reader) for _ in range(3)]
+        for thread in readers:
+            thread.start()
+        for i in range(50):
+            fixer.add_contraction(f"word{i}", f"word {i}")
+            fixer.remove_contraction(f"word{i}")
+        done.set()
+        for thread in readers:
+            thread.join()
+        
+        self.assertEqual(errors, [])
+        self.assertNotIn("word0", fixer.combined_dict)
+
     def test_cache_functionality(self):
         """Test that caching works correctly."""
         # Create fixer with small cache size
@@ -311,6 +354,16 @@ class TestContractionFixer(unittest.TestCase):
         
         # Should still work (cache may have evicted some entries)
         self.assertEqual(fixer.fix(text1), "I cannot do it")
+        
+        # Short texts are cached whole; long ones bypass the text cache
+        misses = fixer._fix_text_cache.cache_info().misses
+        self.assertEqual(fixer.fix("I can't do it. " * 20), "I cannot do it. " * 20)
+        self.assertEqual(fixer._fix_text_cache.cache_info().misses, misses)
+        
+        # Dictionary updates must not serve stale cached texts
+        fixer.add_contraction("can't", "can not")
+        self.assertEqual(fixer.fix(text1), "I can not do it")
+        self.assertEqual(fixer.fix_batch([text1]), ["I can not do it"])
 
     def test_unicode_and_special_characters(self):
         """Test handling of unicode and special characters."""
@@ -365,6 +418,11 @@ class TestContractionFixer(unittest.TestCase):
 
     def test_error_handling_in_load_dict(self):
         """Test error handling in dictionary loading."""
+        # Loaded dictionaries are shared, so drop them to force a reload
+        ContractionFixer._load_dict_optimized.cache_clear()
+        ContractionFixer._standard_reverse_dict.cache_clear()
+        ContractionFixer._default_state.cache_clear()
+        
         with patch('pkgutil.get_data', return_value=None):
             with self.assertRaises(RuntimeError):
                 ContractionFixer()
@@ -377,6 +435,39 @@ class TestContractionFixer(unittest.TestCase):
             with self.assertRaises(RuntimeError):
                 ContractionFixer()
 
+    def test_loaded_dictionaries_are_shared(self):
+        """Test that instances share loaded dictionaries without mutating them."""
+        standard = ContractionFixer._load_dict_optimized("standard_contractions")
+        self.assertIs(ContractionFixer._load_dict_optimized("standard_contractions"), standard)
+        
+        fixer = ContractionFixer(use_informal=False, use_slang=False)
+        fixer.add_contraction("can't", "can not")
+        fixer.remove_contraction("won't")
+        self.assertEqual(standard["can't"], "cannot")
+        self.assertIn("won't", standard)
+        self.assertEqual(ContractionFixer._standard_reverse_dict()["will not"], "won't")
+        self.assertEqual(ContractionFixer().fix("can't, won't"), "cannot, will not")
+        
+        # Fixers with the same configuration share read-only default state
+        first, second = ContractionFixer(), ContractionFixer()
+        self.assertIs(first.combined_dict, second.combined_dict)
+        self.assertIs(first._fix_case_forms, second._fix_case_forms)
+        with self.assertRaises(TypeError):
+            first.combined_dict["zzz"] = "sleep"
+        self.assertNotIn("zzz", second.combined_dict)
+        first.add_contraction("can't", "can not")
+        self.assertEqual(first.fix("can't"), "can not")
+        self.assertEqual(second.fix("can't"), "cannot")
+        self.assertEqual(ContractionFixer().fix("can't"), "cannot")
+
+    def test_marshal_snapshots_match_json_sources(self):
+        """Test that the shipped marshal snapshots are in sync with the JSON sources."""
+        for name in ["standard_contractions", "informal_contractions", "internet_slang"]:
+            with self.subTest(name=name):
+                source = json.loads(pkgutil.get_data("contraction_fix", f"data/{name}.json"))
+                snapshot = marshal.loads(pkgutil.get_data("contraction_fix", f"data/{name}.marshal"))
+                self.assertEqual(snapshot, source)
+
     def test_pattern_property_caching(self):
         """Test that regex patterns are properly cached."""
         fixer = ContractionFixer()
@@ -393,6 +484,98 @@ class TestContractionFixer(unittest.TestCase):
         reverse_pattern2 = fixer.reverse_pattern
         
         self.assertIs(reverse_pattern1, reverse_pattern2)
+        
+        # Fixers with the same dictionary share compiled patterns
+        other = ContractionFixer()
+        self.assertIs(other.pattern, pattern1)
+        self.assertIs(other.reverse_pattern, reverse_pattern1)
+        self.assertIsNot(ContractionFixer(use_slang=False).pattern, pattern1)
+        
+        # Modifying the dictionary only affects that instance
+        other.add_contraction("testword", "test word")
+        self.assertIsNot(other.pattern, pattern1)
+        self.assertIs(fixer.pattern, pattern1)
+
+    def test_word_pattern(self):
+        """Test the apostrophe-free scan used for texts without apostrophes."""
+        fixer = ContractionFixer()
+        self.assertIs(fixer.word_pattern, ContractionFixer().word_pattern)
+        self.assertIsNone(fixer.word_pattern.search("I can't go"))
+        
+        text = "u r gonna luv it btw, w/o doubt"
+        self.assertEqual(fixer.word_pattern.split(text), fixer.pattern.split(text))
+        self.assertEqual(fixer.fix(text), "you are going to love it by the way, without doubt")
+        
+        # Adding an apostrophe key leaves the word pattern untouched
+        word_pattern = fixer.word_pattern
+        fixer.add_contraction("ain't", "is not")
+        self.assertIs(fixer.word_pattern, word_pattern)
+
+    def test_pattern_not_published_after_concurrent_swap(self):
+        """Test that a pattern built from a replaced dictionary is not kept."""
+        fixer = ContractionFixer()
+        original_compile = re.compile
+        
+        def compile_during_swap(*args, **kwargs):
+            # Simulate another thread updating the dictionary mid-build
+            if not fixer.combined_dict.get("racey"):
+                fixer.add_contraction("racey", "race condition")
+            return original_compile(*args, **kwargs)
+        
+        fixer.add_contraction("uniqueword", "unique word")
+        with patch('contraction_fix.fixer.re.compile', side_effect=compile_during_swap):
+            fixer.pattern
+        self.assertIsNone(fixer._pattern)
+        self.assertEqual(fixer.fix("racey"), "race condition")
+
+    def test_trie_regex(self):
+        """Test that the prefix-factored alternation prefers the longest key."""
+        keys = ["i", "i'd", "i'd've", "it", "a.b"]
+        pattern = re.compile("(?:" + _trie_regex(keys) + ")$")
+        for text in keys:
+            with self.subTest(text=text):
+                self.assertTrue(pattern.match(text))
+        self.assertIsNone(pattern.match("axb"))
+        self.assertEqual(_trie_regex([]), "")
+        
+        pattern = re.compile(_trie_regex(["can", "can't", "can't've"]))
+        self.assertEqual(pattern.findall("can't've can't can"), ["can't've", "can't", "can"])
+
+    def test_trie_regex_deep_keys(self):
+        """Test that long keys and deeply nested prefixes still compile."""
+        fixer = ContractionFixer()
+        fixer.add_contraction("a" * 500, "x")
+        self.assertEqual(fixer.fix("hello " + "a" * 500), "hello x")
+
+        fixer = ContractionFixer()
+        fixer.add_contractions({"q" * length: str(length) for length in range(2, 600)})
+        self.assertEqual(fixer.fix("qqq " + "q" * 550), "3 550")
+
+    def test_lowered_view_matching(self):
+        """Test that patterns match a lowercased view without IGNORECASE."""
+        fixer = ContractionFixer()
+        self.assertEqual(fixer.pattern.flags & re.IGNORECASE, 0)
+        for text, expected in [("CaN'T", "Cannot"), ("cAn'T", "cannot"), ("IDK", "I DO NOT KNOW"),
+                               ("W/O", "WITHOUT"), ("id\u212a", "I do not know")]:
+            with self.subTest(text=text):
+                self.assertEqual(fixer.fix(text), expected)
+        
+        # U+0130 lowercases to two code points; offsets must stay aligned
+        self.assertEqual(fixer.fix("\u0130 can't, I can't"), "\u0130 cannot, I cannot")
+        self.assertEqual(fixer.contract("\u0130 do not, I DO NOT"), "\u0130 don't, I DON'T")
+        self.assertEqual(fixer.preview("\u0130 can't")[0].start, 2)
+        
+        # Non-ASCII keys match regardless of case as well
+        fixer.add_contraction("\u00e7a'", "that")
+        self.assertEqual(fixer.fix("\u00c7A' va"), "THAT va")
+
+    def test_first_char_prefilter(self):
+        """Test the candidate-position lookahead built from key first characters."""
+        prefilter = _first_char_prefilter(["can't", "'cause", "w/o", "-x", "can"])
+        self.assertEqual(prefilter, "(?=['\\-cw])")
+        self.assertTrue(re.match(prefilter, "-"))
+        self.assertIsNone(re.match(prefilter, "z"))
+        self.assertEqual(_first_char_prefilter([]), "")
 
     def test_configuration_combinations(self):
         """Test all combinations of configuration options."""
@@ -702,6 +885,25 @@ class TestContractionFixer(unittest.TestCase):
         # Test single item
         self.assertEqual(self.fixer.fix_batch(["I can't"]), ["I cannot"])
 
+    def test_batch_processing_with_workers(self):
+        """Test that multi-process batches match sequential processing."""
+        texts = ["I can't go", "They're here", "We'll see", "It is fine", "I cannot stay"] * 10
+        
+        self.fixer.add_contraction("gotta", "got to")
+        texts.append("I gotta go")
+        
+        self.assertEqual(self.fixer.fix_batch(texts, workers=2), self.fixer.fix_batch(texts))
+        self.assertEqual(self.fixer.contract_batch(texts, workers=2), self.fixer.contract_batch(texts))
+        self.assertEqual(self.fixer.fix_batch(texts, workers=2)[-1], "I got to go")
+        
+        # Small batches stay in-process
+        self.assertEqual(self.fixer.fix_batch(["I can't"], workers=-1), ["I cannot"])
+        
+        # Workers rebuild the caller's class, so subclass overrides apply there too
+        fixer = ShoutingFixer()
+        self.assertEqual(fixer.fix_batch(texts, workers=2), fixer.fix_batch(texts))
+        self.assertEqual(fixer.fix_batch(texts, workers=2)[0], "I CANNOT go")
+
     def test_batch_vs_individual_consistency(self):
         """Ensure batch processing produces same results as individual processing."""
         test_texts = [
@@ -720,6 +922,31 @@ class TestContractionFixer(unittest.TestCase):
         # Should be identical
         self.assertEqual(individual_results, batch_results)
 
+    def test_joined_batch_boundaries(self):
+        """Test that batches scanned as one joined text keep texts independent."""
+        test_texts = ["", "can't", "s", "I can't", "'s fine", "can't", "I İ can't", "w/", "do not"]
+        self.assertEqual(self.fixer.fix_batch(test_texts), [self.fixer.fix(text) for text in test_texts])
+        self.assertEqual(self.fixer.contract_batch(test_texts), [self.fixer.contract(text) for text in test_texts])
+
+        # Inputs holding the separator themselves fall back to one call per text
+        test_texts = ["I can't\x00we'll", "they're"]
+        self.assertEqual(self.fixer.fix_batch(test_texts), ["I cannot\x00we will", "they are"])
+        self.assertEqual(self.fixer.contract_batch(["do not\x00", "we are"]), ["don't\x00", "we're"])
+
+    def test_batch_accepts_iterators(self):
+        """Test that batch methods consume iterators once and return every result."""
+        self.assertEqual(self.fixer.fix_batch(text for text in ["I can't", "we'll"]), ["I cannot", "we will"])
+        self.assertEqual(self.fixer.contract_batch(iter(["do not", "we are"])), ["don't", "we're"])
+
+    def test_batch_with_separator_in_entries(self):
+        """Test that entries holding the batch separator do not shift results between texts."""
+        fixer = ContractionFixer()
+        fixer.add_contraction("foo", "a\x00b")
+        self.assertEqual(fixer.fix_batch(["foo", "bar", "baz"]), ["a\x00b", "bar", "baz"])
+        fixer.remove_contraction("foo")
+        fixer.add_contraction("bar\x00baz", "qux")
+        self.assertEqual(fixer.fix_batch(["bar", "baz"]), ["bar", "baz"])
+
     def test_preview(self):
         text = "I can't believe it's not butter!"
         matches = self.fixer.preview(text)
@@ -762,6 +989,40 @@ class TestContractionFixer(unittest.TestCase):
             with self.subTest(input_text=input_text):
                 self.assertEqual(self.fixer.fix(input_text), expected)
 
+    def test_token_boundaries(self):
+        """Test matches that a whitespace/word tokenizer would split differently."""
+        test_cases = [
+            ("She said 'don't' twice", "She said 'do not' twice"),
+            ("(won't)", "(will not)"),
+            ("I can't've known", "I cannot have known"),
+            ("He'd've gone", "He would have gone"),
+            ("y'all'd've", "you all would have"),
+            ("w/o sugar", "without sugar"),
+        ]
+        
+        for input_text, expected in test_cases:
+            with self.subTest(input_text=input_text):
+                self.assertEqual(self.fixer.fix(input_text), expected)
+
+    def test_time_word_s_contractions(self):
+        """Test that time words are treated as contraction bases for 's."""
+        fixer = ContractionFixer()
+        fixer.add_contraction("today's", "today is")
+        self.assertEqual(fixer.fix("Today's the day"), "Today is the day")
+        self.assertEqual(fixer.fix("the boss's office"), "the boss's office")
+
+    def test_s_contraction_table(self):
+        """Test that the 's check is precomputed for keys where case cannot matter."""
+        fixer = ContractionFixer()
+        self.assertTrue(fixer._s_contractions["it's"])
+        self.assertFalse(fixer._s_contractions["which's"])
+        self.assertNotIn("can't", fixer._s_contractions)
+        
+        # Proper-noun style keys still depend on the matched token's case
+        fixer.add_contraction("john's", "john is")
+        self.assertIsNone(fixer._s_contractions["john's"])
+        self.assertEqual(fixer.fix("john's here, John's car"), "john is here, John's car")
+
     def test_case_preservation(self):
         test_cases = [
             ("I'M GOING HOME", "I AM GOING HOME"),
@@ -774,6 +1035,31 @@ class TestContractionFixer(unittest.TestCase):
             with self.subTest(input_text=input_text):
                 self.assertEqual(self.fixer.fix(input_text), expected)
 
+    def test_case_preservation_after_update(self):
+        fixer = ContractionFixer()
+        fixer.add_contraction("shoulda", "should have")
+        self.assertEqual(fixer.fix("SHOULDA"), "SHOULD HAVE")
+        fixer.add_contraction("shoulda", "should've")
+        self.assertEqual(fixer.fix("SHOULDA"), "SHOULD'VE")
+        self.assertEqual(fixer.fix("Shoulda"), "Should've")
+        fixer.remove_contraction("shoulda")
+        self.assertEqual(fixer.fix("SHOULDA"), "SHOULDA")
+
+    def test_dictionaries_are_read_only(self):
+        """Test that direct edits fail loudly and updates reach every method alike."""
+        fixer = ContractionFixer()
+        with self.assertRaises(TypeError):
+            fixer.combined_dict["foo"] = "bar"
+        with self.assertRaises(TypeError):
+            fixer.reverse_dict["do not"] = "dont"
+        self.assertEqual(fixer.fix("foo it"), "foo it")
+        self.assertEqual(fixer.preview("foo it"), [])
+        
+        fixer.add_contractions({"foo": "bar", "g'day": "good day"})
+        self.assertEqual(fixer.fix("foo it"), "bar it")
+        self.assertEqual(fixer.preview("foo it")[0].replacement, "bar")
+        self.assertEqual(fixer.contract("Good day"), "G'day")
+
     def test_alternate_apostrophes(self):
         test_cases = [
             ("I'd like to", "I would like to"),
@@ -785,8 +1071,35 @@ class TestContractionFixer(unittest.TestCase):
                 # Test with standard apostrophe
                 self.assertEqual(self.fixer.fix(input_text), expected)
                 # Test with curly apostrophe
-                curly_input = input_text.replace("'", "'")
+                curly_input = input_text.replace("'", "\u2019")
                 self.assertEqual(self.fixer.fix(curly_input), expected)
+                # Test with modifier letter apostrophe
+                modifier_input = input_text.replace("'", "\u02bc")
+                self.assertEqual(self.fixer.fix(modifier_input), expected)
+        
+        # Left single quotes open quotations and are never folded
+        quoted = [
+            "\u2018All the best,\u2019 she wrote",
+            "\u2018am I?\u2019 he asked",
+            "the letter \u2018d\u2019 is silent",
+            "an \u2018em dash\u2019 here",
+            "the prefix \u2018re\u2019 means again"
+        ]
+        for text in quoted:
+            with self.subTest(text=text):
+                self.assertEqual(self.fixer.fix(text), text)
+        self.assertEqual(self.fixer.fix("\u2018It\u2019s fine\u2019"), "\u2018It is fine\u2019")
+        
+        # Possessive detection applies to curly apostrophes too
+        self.assertEqual(self.fixer.fix("It\u2019s John\u2019s car"), "It is John\u2019s car")
+        self.assertEqual(self.fixer.fix("It\u02bcs John\u02bcs car"), "It is John\u02bcs car")
+        
+        # Custom contractions are stored once and match either apostrophe
+        self.fixer.add_contraction("y\u2019know", "you know")
+        self.assertNotIn("y\u2019know", self.fixer.combined_dict)
+        self.assertEqual(self.fixer.fix("y'know"), "you know")
+        self.assertEqual(self.fixer.fix("Y\u2019know"), "You know")
+        self.assertEqual(self.fixer.preview("y\u2019know")[0].text, "y\u2019know")
 
     def test_add_remove_contraction(self):
         # Test adding new contraction
@@ -811,6 +1124,39 @@ class TestContractionFixer(unittest.TestCase):
         self.fixer.remove_contraction("wanna")
         self.assertEqual(self.fixer.fix("I wanna go"), "I wanna go")
 
+    def test_bulk_add_compiles_pattern_once(self):
+        """Test that pattern rebuilds are deferred until the next match."""
+        fixer = ContractionFixer()
+        fixer.fix("warm up")
+        
+        with patch('contraction_fix.fixer.re.compile', wraps=re.compile) as compile_mock:
+            for i in range(100):
+                fixer.add_contraction(f"bulkword{i}", f"bulk word {i}")
+            self.assertEqual(compile_mock.call_count, 0)
+            
+            self.assertEqual(fixer.fix("bulkword7 and bulkword42"), "bulk word 7 and bulk word 42")
+            self.assertEqual(compile_mock.call_count, 1)
+
+    def test_add_contractions(self):
+        """Test bulk additions and that no-op updates keep compiled state."""
+        fixer = ContractionFixer()
+        fixer.fix("warm up")
+        
+        with patch('contraction_fix.fixer.re.compile', wraps=re.compile) as compile_mock:
+            fixer.add_contractions({"gotcha": "got you", "lotta": "lot of", "y'know": "you know"})
+            self.assertEqual(fixer.fix("gotcha, lotta stuff"), "got you, lot of stuff")
+            self.assertEqual(fixer.fix("Y'know"), "You know")
+            self.assertEqual(fixer.contract("you know"), "y'know")
+            self.assertEqual(compile_mock.call_count, 3)
+            
+            # Re-adding identical entries or removing unknown ones changes nothing
+            pattern = fixer.pattern
+            fixer.add_contractions({"gotcha": "got you"})
+            fixer.add_contraction("can't", "cannot")
+            fixer.remove_contraction("notakey")
+            self.assertIs(fixer.pattern, pattern)
+            self.assertEqual(compile_mock.call_count, 3)
+
     def test_edge_cases(self):
         """Test various edge cases and boundary conditions."""
         edge_cases = [
@@ -909,6 +1255,15 @@ class TestContractionFixer(unittest.TestCase):
         self.assertEqual(fix(text, use_informal=False), expected)
         self.assertEqual(fix_batch(texts, use_slang=False), expected_batch)
 
+    def test_convenience_functions_reuse_fixers(self):
+        """Test that non-default settings reuse a shared fixer per configuration."""
+        self.assertIs(_get_fixer(True, False), _get_fixer(True, False))
+        self.assertIs(_get_fixer(False, False), _get_fixer(False, False))
+        self.assertIsNot(_get_fixer(True, True), _get_fixer(False, False))
+        
+        self.assertEqual(fix("btw I can't", use_slang=False), "btw I cannot")
+        self.assertEqual(fix("btw I can't", use_slang=False), "btw I cannot")
+
     def test_contract_convenience_functions(self):
         """Test the new contract convenience functions work correctly."""
         text = "I cannot believe it is working"